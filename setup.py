@@ -1,52 +1,10 @@
 """
 Setup script for LazyMode package.
-"""
 
-from setuptools import setup, find_packages
+All project metadata lives in pyproject.toml; this shim only exists for
+tooling that still invokes ``setup.py`` directly.
+"""
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+from setuptools import setup
 
-setup(
-    name="lazymode",
-    version="0.1.0",
-    author="LazyMode Contributors",
-    author_email="",
-    description="Lightweight AI Model for GitHub Issue/PR Markdown Formatting",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/GitGoneWild/lazymode-model",
-    package_dir={"": "src"},
-    packages=find_packages(where="src"),
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Operating System :: OS Independent",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Topic :: Software Development :: Libraries :: Python Modules",
-        "Topic :: Text Processing :: Markup :: Markdown",
-    ],
-    python_requires=">=3.9",
-    install_requires=[
-        "numpy>=1.21.0",
-    ],
-    extras_require={
-        "gpu": ["torch>=2.0.0"],
-        "dev": [
-            "pytest>=7.0.0",
-            "pytest-cov>=4.0.0",
-            "ruff>=0.1.0",
-            "mypy>=1.0.0",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "lazymode-train=lazymode.train:main",
-        ],
-    },
-)
+setup()
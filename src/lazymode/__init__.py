@@ -3,13 +3,28 @@ LazyMode - Lightweight AI Model for GitHub Issue/PR Markdown Formatting
 
 This package provides a lightweight AI model that transforms raw user input
 into polished Markdown formatted specifically for GitHub issues or pull requests.
+
+Public names are resolved lazily (PEP 562), so ``import lazymode`` does not
+load NumPy or the model until one of them is actually accessed. Each name
+only imports its own submodule; ``from lazymode import *`` still loads all
+of them.
 """
 
+import importlib
+from typing import Any, Dict, List
+
 __version__ = "0.1.0"
 
-from .data import generate_training_data, load_dataset
-from .inference import format_github_issue, load_model
-from .model import LazyModeModel
+# Maps each public name to the submodule that defines it
+_LAZY: Dict[str, str] = {
+    "LazyModeModel": "model",
+    "format_github_issue": "inference",
+    "load_model": "inference",
+    "generate_training_data": "data",
+    "load_dataset": "data",
+    "prepare_training_pairs": "data",
+    "get_training_arrays": "data",
+}
 
 __all__ = [
     "LazyModeModel",
@@ -17,4 +32,20 @@ __all__ = [
     "load_model",
     "generate_training_data",
     "load_dataset",
+    "prepare_training_pairs",
+    "get_training_arrays",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access and cache it."""
+    if name in _LAZY:
+        module = importlib.import_module("." + _LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
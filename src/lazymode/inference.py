@@ -6,28 +6,58 @@ to format GitHub issues and pull requests.
 """
 
 import os
+import threading
 from typing import Optional
 
-from .data import generate_training_data, prepare_training_pairs
+from .data import get_training_arrays
 from .model import LazyModeModel
 
 # Global model instance for convenience
 _global_model: Optional[LazyModeModel] = None
+# Serializes the lazy first load so concurrent callers train/load only once
+_global_model_lock = threading.Lock()
+
+
+# Model trained on the full built-in corpus, shipped as package data so a
+# fresh install never has to fit the vectorizer on first use. It is
+# read-only: retrained models are saved to the user cache instead.
+PREBUILT_MODEL_PATH = os.path.join(os.path.dirname(__file__), "prebuilt.npz")
+
+
+def get_user_model_path() -> str:
+    """
+    Get the path of the model in the user cache directory.
+
+    Retrained models are saved here, under ``$XDG_CACHE_HOME`` (or
+    ``~/.cache``), never over the prebuilt model shipped with the package.
+    """
+    cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_dir, "lazymode", "lazymode.npz")
 
 
 def get_default_model_path() -> str:
-    """Get the default path for the trained model."""
-    return os.path.join(os.path.dirname(__file__), "..", "..", "models", "lazymode.pkl")
+    """
+    Get the default path for the trained model.
+
+    Returns the user cache model if one has been trained, otherwise the
+    prebuilt model shipped with the package. Falls back to the user cache
+    path if neither exists yet.
+    """
+    user_path = get_user_model_path()
+    if not os.path.exists(user_path) and os.path.exists(PREBUILT_MODEL_PATH):
+        return PREBUILT_MODEL_PATH
+    return user_path
 
 
 def load_model(
-    filepath: Optional[str] = None, use_gpu: bool = True, force_retrain: bool = False
+    filepath: Optional[str] = None, use_gpu: bool = False, force_retrain: bool = False
 ) -> LazyModeModel:
     """
     Load a trained LazyMode model.
 
     If no filepath is provided, uses the default model location.
-    If the model doesn't exist, trains a new one.
+    If the model doesn't exist, trains a new one. Models trained in place
+    of the prebuilt one are saved to the user cache path.
 
     Args:
         filepath: Path to the model file. If None, uses default.
@@ -44,7 +74,9 @@ def load_model(
 
     # Check if we need to train a new model
     if not os.path.exists(filepath) or force_retrain:
-        print(f"Model not found at {filepath}. Training new model...")
+        if os.path.realpath(filepath) == os.path.realpath(PREBUILT_MODEL_PATH):
+            filepath = get_user_model_path()
+        print(f"Training new model, saving to {filepath}...")
         model = train_and_save_model(filepath, use_gpu=use_gpu)
     else:
         model = LazyModeModel.load(filepath, use_gpu=use_gpu)
@@ -53,7 +85,7 @@ def load_model(
     return model
 
 
-def train_and_save_model(filepath: str, use_gpu: bool = True) -> LazyModeModel:
+def train_and_save_model(filepath: str, use_gpu: bool = False) -> LazyModeModel:
     """
     Train a new model and save it.
 
@@ -64,27 +96,39 @@ def train_and_save_model(filepath: str, use_gpu: bool = True) -> LazyModeModel:
     Returns:
         Trained LazyModeModel.
     """
-    # Generate training data
-    data = generate_training_data()
-    pairs = prepare_training_pairs(data)
-    inputs, outputs = zip(*pairs)
+    inputs, outputs = get_training_arrays()
 
     # Create and train model
     model = LazyModeModel(n_neighbors=3, max_features=500, use_gpu=use_gpu)
-    model.train(list(inputs), list(outputs))
-
-    # Ensure directory exists
-    dir_path = os.path.dirname(filepath) or "."
-    os.makedirs(dir_path, exist_ok=True)
+    model.train(inputs, outputs)
 
-    # Save model
+    # Save model (creates the directory if needed)
     model.save(filepath)
 
     return model
 
 
+def _get_global_model(use_gpu: bool = False) -> LazyModeModel:
+    """
+    Get the global model, loading it on first use.
+
+    Args:
+        use_gpu: Whether to use GPU if available (only used if loading model).
+
+    Returns:
+        The shared LazyModeModel.
+    """
+    model = _global_model
+    if model is None:
+        with _global_model_lock:
+            model = _global_model
+            if model is None:
+                model = load_model(use_gpu=use_gpu)
+    return model
+
+
 def format_github_issue(
-    raw_input: str, model: Optional[LazyModeModel] = None, use_gpu: bool = True
+    raw_input: str, model: Optional[LazyModeModel] = None, use_gpu: bool = False
 ) -> str:
     """
     Format a raw input into a GitHub-ready Markdown issue.
@@ -106,18 +150,14 @@ def format_github_issue(
         ## Bug Report: Login Button Crashes The App
         ...
     """
-    global _global_model
-
     if model is None:
-        if _global_model is None:
-            _global_model = load_model(use_gpu=use_gpu)
-        model = _global_model
+        model = _get_global_model(use_gpu=use_gpu)
 
     return model.predict(raw_input)
 
 
 def format_multiple_issues(
-    raw_inputs: list, model: Optional[LazyModeModel] = None, use_gpu: bool = True
+    raw_inputs: list, model: Optional[LazyModeModel] = None, use_gpu: bool = False
 ) -> list:
     """
     Format multiple raw inputs into GitHub-ready Markdown issues.
@@ -130,14 +170,10 @@ def format_multiple_issues(
     Returns:
         List of formatted Markdown strings.
     """
-    global _global_model
-
     if model is None:
-        if _global_model is None:
-            _global_model = load_model(use_gpu=use_gpu)
-        model = _global_model
+        model = _get_global_model(use_gpu=use_gpu)
 
-    return [model.predict(raw_input) for raw_input in raw_inputs]
+    return model.predict_batch(raw_inputs)
 
 
 def quick_format(raw_input: str) -> str:
@@ -153,14 +189,11 @@ def quick_format(raw_input: str) -> str:
     Returns:
         Formatted Markdown string.
     """
-    # Generate training data
-    data = generate_training_data()
-    pairs = prepare_training_pairs(data)
-    inputs, outputs = zip(*pairs)
+    inputs, outputs = get_training_arrays()
 
     # Create and train model in memory
     model = LazyModeModel(n_neighbors=3, max_features=500, use_gpu=False)
-    model.train(list(inputs), list(outputs), verbose=False)
+    model.train(inputs, outputs, verbose=False)
 
     return model.predict(raw_input)
 
@@ -182,9 +215,12 @@ if __name__ == "__main__":
     print("LazyMode - GitHub Issue Formatter Demo\n")
     print("=" * 60)
 
-    for test_input in test_inputs:
+    # Load once and format every input in a single batch
+    demo_model = load_model(use_gpu=False)
+    results = format_multiple_issues(test_inputs, model=demo_model)
+
+    for test_input, result in zip(test_inputs, results):
         print(f"\n\nInput: {test_input}")
         print("-" * 60)
-        result = format_github_issue(test_input, use_gpu=False)
         print(result)
         print("=" * 60)
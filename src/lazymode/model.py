@@ -5,13 +5,114 @@ This module implements a lightweight model using template matching and text
 generation techniques optimized for CPU usage with optional GPU acceleration.
 """
 
+import contextlib
+import importlib.util
+import json
 import os
-import pickle
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 
+# Alphanumeric runs that form whole words. The \b anchors stop fragments of
+# words containing other word characters (e.g. "foo_bar", "café") from being
+# emitted as tokens
+_TOKEN_RE = re.compile(r"\b[a-z0-9]+\b")
+
+# ASCII fast path for the same tokens: every ASCII character that is not a
+# word character becomes a space, so str.split() yields the word runs and
+# runs containing "_" are exactly the ones _TOKEN_RE rejects
+_ASCII_NON_WORD = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if not (c.isalnum() or c == "_")}
+)
+
+# Every .npz archive is a zip file and starts with a zip local file header;
+# models pickled by older versions do not
+_NPZ_MAGIC = b"PK\x03\x04"
+
+# Issue types in priority order, each with the keywords (matched anywhere in
+# the lowercased text) that select it. Each keyword list is compiled into one
+# alternation so a category is checked with a single scan of the text.
+_ISSUE_TYPE_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Bug Report", ("crash", "error", "fail", "broken", "not working", "bug")),
+    ("Feature Request", ("add", "new", "implement", "create", "feature")),
+    ("Performance Issue", ("slow", "performance", "memory", "cpu", "lag")),
+    ("Documentation", ("docs", "document", "readme", "help")),
+)
+_ISSUE_TYPE_PATTERNS = tuple(
+    (issue_type, re.compile("|".join(map(re.escape, keywords))))
+    for issue_type, keywords in _ISSUE_TYPE_KEYWORDS
+)
+
+
+def _pack_strings(strings: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack strings into one UTF-8 byte buffer for saving.
+
+    Args:
+        strings: Strings to pack.
+
+    Returns:
+        Tuple of (buffer, offsets): string i is ``buffer[offsets[i]:offsets[i + 1]]``.
+    """
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _unpack_strings(buffer: np.ndarray, offsets: np.ndarray) -> List[str]:
+    """
+    Unpack strings packed by _pack_strings.
+
+    Args:
+        buffer: UTF-8 byte buffer.
+        offsets: Start offset of each string, followed by the buffer length.
+
+    Returns:
+        List of the packed strings.
+    """
+    data = buffer.tobytes()
+    bounds = offsets.tolist()
+    return [data[start:end].decode("utf-8") for start, end in zip(bounds, bounds[1:])]
+
+
+def _find_template_patch(template_output: str) -> Tuple[int, int, int]:
+    """
+    Locate the parts of a template output that get adapted to a new input.
+
+    Args:
+        template_output: Template output from training data.
+
+    Returns:
+        Tuple of (title_end, description_start, description_end). title_end
+        is the end of the leading "##" title line, and the description span
+        covers the first body line of the "### Description" section. Each is
+        -1 when the template has no such line.
+    """
+    lines = template_output.split("\n")
+    title_end = len(lines[0]) if lines[0].startswith("##") else -1
+
+    # The replacement title never reads "### Description", so skip it
+    offset = len(lines[0]) + 1 if title_end >= 0 else 0
+    first = 1 if title_end >= 0 else 0
+    for i in range(first, len(lines)):
+        if lines[i].strip() == "### Description":
+            # Find next section
+            offset += len(lines[i]) + 1
+            for line in lines[i + 1 :]:
+                if line.startswith("###"):
+                    break
+                if line.strip() and not line.startswith("#"):
+                    return title_end, offset, offset + len(line)
+                offset += len(line) + 1
+            break
+        offset += len(lines[i]) + 1
+
+    return title_end, -1, -1
+
 
 class TextVectorizer:
     """
@@ -29,6 +130,8 @@ class TextVectorizer:
         self.max_features = max_features
         self.vocabulary: Dict[str, int] = {}
         self.idf: Dict[str, float] = {}
+        # IDF weights indexed by vocabulary column, rebuilt by _index_idf
+        self._idf_vector: np.ndarray = np.empty(0)
         self.fitted = False
 
     def _tokenize(self, text: str) -> List[str]:
@@ -43,47 +146,62 @@ class TextVectorizer:
         """
         # Lowercase and extract alphanumeric tokens
         text = text.lower()
-        tokens = re.findall(r"\b[a-z0-9]+\b", text)
-        return tokens
+        if text.isascii():
+            return [token for token in text.translate(_ASCII_NON_WORD).split() if "_" not in token]
+        return _TOKEN_RE.findall(text)
 
-    def fit(self, texts: List[str]) -> "TextVectorizer":
+    def fit(self, texts: Sequence[str]) -> "TextVectorizer":
         """
         Fit the vectorizer on training texts.
 
         Args:
             texts: List of training texts.
 
+        Returns:
+            Self for chaining.
+        """
+        return self._fit_tokens([self._tokenize(text) for text in texts])
+
+    def _fit_tokens(self, documents: Sequence[List[str]]) -> "TextVectorizer":
+        """
+        Fit the vectorizer on already tokenized training texts.
+
+        Args:
+            documents: Token list of each training text.
+
         Returns:
             Self for chaining.
         """
         # Count document frequency
-        doc_freq: Dict[str, int] = {}
-        all_tokens: Dict[str, int] = {}
+        doc_freq: Counter[str] = Counter()
 
-        for text in texts:
-            tokens = set(self._tokenize(text))
-            for token in tokens:
-                doc_freq[token] = doc_freq.get(token, 0) + 1
-                all_tokens[token] = all_tokens.get(token, 0) + 1
+        for tokens in documents:
+            doc_freq.update(set(tokens))
 
         # Select top features by frequency
-        sorted_tokens = sorted(all_tokens.items(), key=lambda x: x[1], reverse=True)
-        top_tokens = [token for token, _ in sorted_tokens[: self.max_features]]
+        top_tokens = [token for token, _ in doc_freq.most_common(self.max_features)]
 
         # Create vocabulary
         self.vocabulary = {token: idx for idx, token in enumerate(top_tokens)}
 
         # Calculate IDF
-        n_docs = len(texts)
+        n_docs = len(documents)
         self.idf = {
             token: np.log((n_docs + 1) / (doc_freq.get(token, 0) + 1)) + 1
             for token in self.vocabulary
         }
+        self._index_idf()
 
         self.fitted = True
         return self
 
-    def transform(self, texts: List[str]) -> np.ndarray:
+    def _index_idf(self) -> None:
+        """Cache the IDF weights as an array aligned with the vocabulary columns."""
+        self._idf_vector = np.zeros(len(self.vocabulary))
+        for token, idx in self.vocabulary.items():
+            self._idf_vector[idx] = self.idf[token]
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
         """
         Transform texts to TF-IDF vectors.
 
@@ -96,29 +214,49 @@ class TextVectorizer:
         if not self.fitted:
             raise ValueError("Vectorizer must be fitted before transform")
 
-        vectors: np.ndarray = np.zeros((len(texts), len(self.vocabulary)))
+        return self._transform_tokens([self._tokenize(text) for text in texts])
+
+    def _transform_tokens(self, documents: Sequence[List[str]]) -> np.ndarray:
+        """
+        Transform already tokenized texts to TF-IDF vectors.
+
+        Args:
+            documents: Token list of each text.
+
+        Returns:
+            NumPy array of shape (n_texts, n_features).
+        """
+        # Collect the nonzero entries as (row, column, count) triples and
+        # scatter them into the matrix in one assignment
+        rows: List[int] = []
+        cols: List[int] = []
+        counts: List[int] = []
 
-        for i, text in enumerate(texts):
-            tokens = self._tokenize(text)
+        for i, tokens in enumerate(documents):
             # Count term frequency
-            tf: Dict[str, int] = {}
-            for token in tokens:
-                if token in self.vocabulary:
-                    tf[token] = tf.get(token, 0) + 1
+            tf = Counter(tokens)
 
-            # Calculate TF-IDF
             for token, count in tf.items():
-                idx = self.vocabulary[token]
-                vectors[i, idx] = count * self.idf[token]
-
-            # Normalize
-            norm = np.linalg.norm(vectors[i])
-            if norm > 0:
-                vectors[i] /= norm
+                idx = self.vocabulary.get(token)
+                if idx is None:
+                    continue
+                rows.append(i)
+                cols.append(idx)
+                counts.append(count)
+
+        # Calculate TF-IDF for all entries at once.
+        # Single precision is ample for TF-IDF weights and halves the memory
+        # the similarity product has to stream through
+        vectors: np.ndarray = np.zeros((len(documents), len(self.vocabulary)), dtype=np.float32)
+        vectors[rows, cols] = np.asarray(counts) * self._idf_vector[cols]
+
+        # Normalize every row at once, leaving all-zero rows untouched
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms > 0, norms, 1.0)
 
         return vectors
 
-    def fit_transform(self, texts: List[str]) -> np.ndarray:
+    def fit_transform(self, texts: Sequence[str]) -> np.ndarray:
         """
         Fit and transform in one step.
 
@@ -128,8 +266,10 @@ class TextVectorizer:
         Returns:
             Transformed vectors.
         """
-        self.fit(texts)
-        return self.transform(texts)
+        # Tokenize once and share the tokens between fitting and transforming
+        documents = [self._tokenize(text) for text in texts]
+        self._fit_tokens(documents)
+        return self._transform_tokens(documents)
 
 
 class LazyModeModel:
@@ -140,6 +280,23 @@ class LazyModeModel:
     optimized for CPU with optional GPU acceleration.
     """
 
+    # Below this many training examples the whole similarity search takes
+    # well under a millisecond on CPU, so a GPU only adds transfer overhead
+    GPU_MIN_EXAMPLES = 10_000
+
+    # Maximum number of distinct inputs whose predictions are memoized; the
+    # least recently used entry is evicted beyond this
+    PREDICT_CACHE_SIZE = 1024
+
+    # Attributes that predictions depend on; assigning any of them drops the
+    # memoized predictions
+    _PREDICTION_STATE = frozenset(
+        {"n_neighbors", "vectorizer", "training_outputs", "_template_patches", "training_vectors"}
+    )
+
+    # Result of the first GPU probe, shared by every instance in the process
+    _detected_device: Optional[str] = None
+
     def __init__(self, n_neighbors: int = 3, max_features: int = 500, use_gpu: bool = True):
         """
         Initialize the LazyMode model.
@@ -152,40 +309,105 @@ class LazyModeModel:
         self.n_neighbors = n_neighbors
         self.max_features = max_features
         self.use_gpu = use_gpu
+        # Device chosen by _setup_device; self.device may drop back to the
+        # CPU for small corpora, re-checked whenever the training data changes
+        self._requested_device = "cpu"
         self.device = "cpu"
 
         self.vectorizer = TextVectorizer(max_features=max_features)
         self.training_inputs: List[str] = []
         self.training_outputs: List[str] = []
+        # Per output, the spans _adapt_output replaces (see _find_template_patch)
+        self._template_patches: List[Tuple[int, int, int]] = []
         self.training_vectors: Optional[np.ndarray] = None
+        # Copy of training_vectors on self.device, created on first GPU search
+        self._training_tensor: Any = None
+        # Predictions are deterministic for trained weights, so repeated
+        # inputs are served from here; cleared whenever prediction state is
+        # reassigned. The generation counts clears, so a prediction computed
+        # before one is never stored after it
+        self._predict_cache: OrderedDict[str, str] = OrderedDict()
+        self._predict_generation = 0
+        self._predict_cache_lock = threading.Lock()
         self.is_trained = False
 
         # Check GPU availability
         self._setup_device()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self._PREDICTION_STATE and "_predict_cache_lock" in self.__dict__:
+            self._clear_predict_cache()
+
+    def _clear_predict_cache(self) -> None:
+        """Drop every memoized prediction, including ones still being computed."""
+        with self._predict_cache_lock:
+            self._predict_cache.clear()
+            self._predict_generation += 1
+
     def _setup_device(self) -> None:
         """Set up computation device (CPU or GPU)."""
         if self.use_gpu:
-            try:
-                import torch
-
-                if torch.cuda.is_available():
-                    self.device = "cuda"
-                    print("GPU detected: Using CUDA for acceleration")
-                elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                    self.device = "mps"
-                    print("GPU detected: Using Apple MPS for acceleration")
-                else:
-                    self.device = "cpu"
-                    print("No GPU detected: Using CPU")
-            except ImportError:
-                self.device = "cpu"
-                print("PyTorch not available: Using CPU with NumPy")
+            # The probe imports torch and queries the driver, so run it once
+            # per process and share the result between instances
+            if LazyModeModel._detected_device is None:
+                LazyModeModel._detected_device = self._probe_device()
+            self._requested_device = LazyModeModel._detected_device
         else:
-            self.device = "cpu"
+            self._requested_device = "cpu"
             print("Using CPU (GPU disabled)")
+        self.device = self._requested_device
+
+    @staticmethod
+    def _probe_device() -> str:
+        """
+        Detect the best available computation device.
+
+        Returns:
+            "cuda", "mps", or "cpu".
+        """
+        # Probe for torch without importing it so CPU-only installs skip
+        # the import (and the CUDA device query) entirely
+        if importlib.util.find_spec("torch") is None:
+            print("PyTorch not available: Using CPU with NumPy")
+            return "cpu"
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                print("GPU detected: Using CUDA for acceleration")
+                return "cuda"
+            if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+                print("GPU detected: Using Apple MPS for acceleration")
+                return "mps"
+            print("No GPU detected: Using CPU")
+            return "cpu"
+        except ImportError:
+            print("PyTorch not available: Using CPU with NumPy")
+            return "cpu"
+        except (OSError, RuntimeError) as e:
+            # Broken CUDA installs fail while loading libraries or drivers
+            print(f"PyTorch failed to initialize ({e}): Using CPU with NumPy")
+            return "cpu"
+
+    def _check_corpus_size_for_device(self) -> None:
+        """Fall back to CPU when the training corpus is too small for a GPU to help."""
+        self.device = self._requested_device
+        if self.device != "cpu" and len(self.training_inputs) < self.GPU_MIN_EXAMPLES:
+            print(
+                f"Corpus has fewer than {self.GPU_MIN_EXAMPLES} examples: "
+                f"Using CPU instead of {self.device}"
+            )
+            self.device = "cpu"
+
+    def _set_training_outputs(self, outputs: Sequence[str]) -> None:
+        """Store the training outputs and locate the spans adapted at prediction time."""
+        self.training_outputs = list(outputs)
+        self._template_patches = [_find_template_patch(output) for output in outputs]
 
-    def train(self, inputs: List[str], outputs: List[str], verbose: bool = True) -> Dict[str, Any]:
+    def train(
+        self, inputs: Sequence[str], outputs: Sequence[str], verbose: bool = True
+    ) -> Dict[str, Any]:
         """
         Train the model on input-output pairs.
 
@@ -204,11 +426,13 @@ class LazyModeModel:
             print(f"Training on {len(inputs)} examples...")
 
         # Store training data
-        self.training_inputs = inputs
-        self.training_outputs = outputs
+        self.training_inputs = list(inputs)
+        self._set_training_outputs(outputs)
+        self._check_corpus_size_for_device()
 
         # Fit vectorizer and transform inputs
         self.training_vectors = self.vectorizer.fit_transform(inputs)
+        self._training_tensor = None
 
         self.is_trained = True
 
@@ -223,31 +447,90 @@ class LazyModeModel:
 
         return metrics
 
-    def _find_nearest_neighbors(self, query_vector: np.ndarray, k: int) -> List[Tuple[int, float]]:
+    def _find_nearest_neighbors(
+        self, query_vectors: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Find k nearest neighbors using cosine similarity.
+        Find the k nearest neighbors of each query using cosine similarity.
 
         Args:
-            query_vector: Query vector.
+            query_vectors: Query vectors of shape (n_queries, n_features).
             k: Number of neighbors.
 
         Returns:
-            List of (index, similarity) tuples.
+            Tuple of (indices, similarities), each of shape (n_queries, k),
+            ordered from most to least similar. Equal similarities are
+            ordered by training index, lowest first.
         """
         if self.training_vectors is None:
             raise ValueError("Model must be trained before inference")
 
-        # Calculate cosine similarities
-        similarities = np.dot(self.training_vectors, query_vector)
+        # Keep both operands C-contiguous float32 so the product runs as sgemm
+        query_vectors = np.ascontiguousarray(query_vectors, dtype=np.float32)
+
+        if self.device != "cpu":
+            return self._find_nearest_neighbors_torch(query_vectors, k)
+
+        # Calculate cosine similarities for all queries in one product
+        similarities = query_vectors @ self.training_vectors.T
+
+        # Get top k indices per query: partition in O(N), then sort only the k
+        k = min(k, similarities.shape[1])
+        if k == 0:
+            empty = np.empty((len(similarities), 0), dtype=np.intp)
+            return empty, similarities[:, :0]
+        top_indices = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        # argpartition picks arbitrarily among scores tied with the kth best,
+        # so in rows with such ties keep every strictly better score and
+        # fill the rest with the lowest-index ties, both found in O(N)
+        kth_best = np.take_along_axis(similarities, top_indices, axis=1).min(axis=1)
+        tied = np.count_nonzero(similarities >= kth_best[:, None], axis=1) > k
+        for row in np.flatnonzero(tied):
+            row_similarities = similarities[row]
+            better = np.flatnonzero(row_similarities > kth_best[row])
+            ties = np.flatnonzero(row_similarities == kth_best[row])[: k - len(better)]
+            top_indices[row] = np.concatenate((better, ties))
+        # Ascending indices, so the stable sort below breaks ties by index
+        top_indices.sort(axis=1)
+        top_similarities = np.take_along_axis(similarities, top_indices, axis=1)
+        order = np.argsort(-top_similarities, axis=1, kind="stable")
+
+        return (
+            np.take_along_axis(top_indices, order, axis=1),
+            np.take_along_axis(top_similarities, order, axis=1),
+        )
 
-        # Get top k indices
-        if k >= len(similarities):
-            top_indices = np.argsort(similarities)[::-1]
-        else:
-            top_indices = np.argpartition(similarities, -k)[-k:]
-            top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
+    def _find_nearest_neighbors_torch(
+        self, query_vectors: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find nearest neighbors on the GPU with PyTorch.
 
-        return [(int(idx), float(similarities[idx])) for idx in top_indices[:k]]
+        The training vectors are copied to the device once and reused, so
+        each call only transfers the queries and the top k results. Unlike
+        the CPU search, equal similarities keep whatever order topk returns
+        rather than ranking by training index.
+
+        Args:
+            query_vectors: Query vectors of shape (n_queries, n_features).
+            k: Number of neighbors.
+
+        Returns:
+            Tuple of (indices, similarities), each of shape (n_queries, k),
+            ordered from most to least similar.
+        """
+        import torch
+
+        if self._training_tensor is None:
+            self._training_tensor = torch.from_numpy(self.training_vectors).to(self.device)
+
+        queries = torch.from_numpy(query_vectors).to(self.device)
+        similarities = queries @ self._training_tensor.T
+
+        k = min(k, similarities.shape[1])
+        top_similarities, top_indices = similarities.topk(k, dim=1)
+
+        return top_indices.cpu().numpy(), top_similarities.cpu().numpy()
 
     def _extract_issue_type(self, text: str) -> str:
         """
@@ -261,19 +544,10 @@ class LazyModeModel:
         """
         text_lower = text.lower()
 
-        if any(
-            word in text_lower
-            for word in ["crash", "error", "fail", "broken", "not working", "bug"]
-        ):
-            return "Bug Report"
-        elif any(word in text_lower for word in ["add", "new", "implement", "create", "feature"]):
-            return "Feature Request"
-        elif any(word in text_lower for word in ["slow", "performance", "memory", "cpu", "lag"]):
-            return "Performance Issue"
-        elif any(word in text_lower for word in ["docs", "document", "readme", "help"]):
-            return "Documentation"
-        else:
-            return "Bug Report"
+        for issue_type, pattern in _ISSUE_TYPE_PATTERNS:
+            if pattern.search(text_lower):
+                return issue_type
+        return "Bug Report"
 
     def _generate_fallback_output(self, input_text: str) -> str:
         """
@@ -335,39 +609,93 @@ class LazyModeModel:
         Returns:
             Formatted Markdown output.
         """
+        return self.predict_batch([input_text])[0]
+
+    def predict_batch(self, input_texts: Sequence[str]) -> List[str]:
+        """
+        Generate formatted Markdown outputs for several inputs at once.
+
+        All inputs are vectorized and matched against the training data in
+        a single pass, which is faster than calling predict in a loop.
+        Inputs seen before are answered from a per-model cache.
+
+        Args:
+            input_texts: Raw input texts.
+
+        Returns:
+            Formatted Markdown outputs, in the same order as the inputs.
+        """
         if not self.is_trained:
             raise ValueError("Model must be trained before prediction")
 
-        # Vectorize input
-        query_vector = self.vectorizer.transform([input_text])[0]
+        if not input_texts:
+            return []
 
-        # Find nearest neighbors
-        neighbors = self._find_nearest_neighbors(query_vector, self.n_neighbors)
+        cache = self._predict_cache
+        results: Dict[str, str] = {}
+        with self._predict_cache_lock:
+            generation = self._predict_generation
+            for text in dict.fromkeys(input_texts):
+                if text in cache:
+                    cache.move_to_end(text)
+                    results[text] = cache[text]
+
+        missing = [text for text in dict.fromkeys(input_texts) if text not in results]
+        if missing:
+            computed = self._predict_uncached(missing)
+            results.update(zip(missing, computed))
+            with self._predict_cache_lock:
+                if generation == self._predict_generation:
+                    cache.update(zip(missing, computed))
+                    while len(cache) > self.PREDICT_CACHE_SIZE:
+                        cache.popitem(last=False)
+
+        return [results[text] for text in input_texts]
+
+    def _predict_uncached(self, input_texts: Sequence[str]) -> List[str]:
+        """
+        Run the nearest-neighbor prediction for inputs, bypassing the cache.
+
+        Args:
+            input_texts: Raw input texts.
+
+        Returns:
+            Formatted Markdown outputs, in the same order as the inputs.
+        """
+        # Vectorize inputs
+        query_vectors = self.vectorizer.transform(input_texts)
 
-        if not neighbors or neighbors[0][1] < 0.1:
-            # No good match found, use fallback
-            return self._generate_fallback_output(input_text)
+        # Find nearest neighbors
+        indices, similarities = self._find_nearest_neighbors(query_vectors, self.n_neighbors)
 
-        # Use best matching template
-        best_idx, best_sim = neighbors[0]
-        best_output = self.training_outputs[best_idx]
+        if indices.shape[1] == 0:
+            return [self._generate_fallback_output(input_text) for input_text in input_texts]
 
-        # Adapt the output based on input
-        adapted_output = self._adapt_output(input_text, best_output)
+        results = []
+        for input_text, best_idx, best_sim in zip(input_texts, indices[:, 0], similarities[:, 0]):
+            if best_sim < 0.1:
+                # No good match found, use fallback
+                results.append(self._generate_fallback_output(input_text))
+            else:
+                # Use best matching template, adapted to the input
+                results.append(self._adapt_output(input_text, best_idx))
 
-        return adapted_output
+        return results
 
-    def _adapt_output(self, input_text: str, template_output: str) -> str:
+    def _adapt_output(self, input_text: str, template_index: int) -> str:
         """
         Adapt a template output to the new input.
 
         Args:
             input_text: New input text.
-            template_output: Template output from training data.
+            template_index: Index of the template output in the training data.
 
         Returns:
             Adapted output.
         """
+        template_output = self.training_outputs[template_index]
+        title_end, description_start, description_end = self._template_patches[template_index]
+
         # Extract issue type and create new title
         issue_type = self._extract_issue_type(input_text)
 
@@ -378,24 +706,22 @@ class LazyModeModel:
         title = title.title()
 
         # Update the title line
-        lines = template_output.split("\n")
-        if lines and lines[0].startswith("##"):
-            lines[0] = f"## {issue_type}: {title}"
-
-        # Update description if present
-        for i, line in enumerate(lines):
-            if line.strip() == "### Description":
-                # Find next section
-                j = i + 1
-                while j < len(lines) and not lines[j].startswith("###"):
-                    if lines[j].strip() and not lines[j].startswith("#"):
-                        # Replace first description line with input
-                        lines[j] = input_text
-                        break
-                    j += 1
-                break
-
-        return "\n".join(lines)
+        if title_end >= 0:
+            head = f"## {issue_type}: {title}"
+            start = title_end
+        else:
+            head = ""
+            start = 0
+
+        # Replace the first description line with the input, if present
+        if description_start >= 0:
+            return (
+                head
+                + template_output[start:description_start]
+                + input_text
+                + template_output[description_end:]
+            )
+        return head + template_output[start:]
 
     def save(self, filepath: str) -> None:
         """
@@ -407,23 +733,43 @@ class LazyModeModel:
         if not self.is_trained:
             raise ValueError("Model must be trained before saving")
 
-        dir_path = os.path.dirname(filepath) or "."
-        os.makedirs(dir_path, exist_ok=True)
+        dir_path = os.path.dirname(filepath)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
 
-        model_data = {
+        # Vocabulary tokens in column order; the IDF weights share that order
+        tokens = sorted(self.vectorizer.vocabulary, key=self.vectorizer.vocabulary.__getitem__)
+        metadata = {
             "n_neighbors": self.n_neighbors,
             "max_features": self.max_features,
-            "vectorizer_vocabulary": self.vectorizer.vocabulary,
-            "vectorizer_idf": self.vectorizer.idf,
-            "training_inputs": self.training_inputs,
-            "training_outputs": self.training_outputs,
-            "training_vectors": self.training_vectors.tolist()
-            if self.training_vectors is not None
-            else None,
+            "vectorizer_vocabulary": tokens,
         }
-
-        with open(filepath, "wb") as f:
-            pickle.dump(model_data, f)
+        arrays: Dict[str, Any] = {
+            "metadata": np.frombuffer(json.dumps(metadata).encode("utf-8"), dtype=np.uint8),
+            "vectorizer_idf": np.array(
+                [self.vectorizer.idf[token] for token in tokens], dtype=np.float64
+            ),
+        }
+        for name, strings in (
+            ("training_inputs", self.training_inputs),
+            ("training_outputs", self.training_outputs),
+        ):
+            arrays[name], arrays[f"{name}_offsets"] = _pack_strings(strings)
+        if self.training_vectors is not None:
+            arrays["training_vectors"] = self.training_vectors
+
+        # Write to a temporary file and rename it into place, so readers never
+        # see a partially written model
+        tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            # The temporary file is missing if open() itself failed
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
 
         print(f"Model saved to {filepath}")
 
@@ -432,9 +778,9 @@ class LazyModeModel:
         """
         Load a trained model from a file.
 
-        Warning:
-            Only load model files from trusted sources. Pickle files can
-            contain arbitrary code that will be executed during loading.
+        Model files are NumPy ``.npz`` archives read with pickling disabled,
+        so loading one never executes code from the file. Other files, such
+        as models pickled by older versions, raise a ValueError.
 
         Args:
             filepath: Path to the saved model.
@@ -444,29 +790,53 @@ class LazyModeModel:
             Loaded LazyModeModel instance.
         """
         with open(filepath, "rb") as f:
-            model_data = pickle.load(f)  # noqa: S301
+            magic = f.read(len(_NPZ_MAGIC))
+        if magic != _NPZ_MAGIC:
+            raise ValueError(
+                f"{filepath} is not a LazyMode .npz model. Pickled models from older "
+                "versions are no longer supported; retrain with "
+                "load_model(force_retrain=True) or lazymode-train to regenerate it."
+            )
+
+        with np.load(filepath, allow_pickle=False) as archive:
+            metadata = json.loads(archive["metadata"].tobytes().decode("utf-8"))
+            idf = archive["vectorizer_idf"]
+            training_inputs = _unpack_strings(
+                archive["training_inputs"], archive["training_inputs_offsets"]
+            )
+            training_outputs = _unpack_strings(
+                archive["training_outputs"], archive["training_outputs_offsets"]
+            )
+            training_vectors = (
+                archive["training_vectors"] if "training_vectors" in archive.files else None
+            )
 
         model = cls(
-            n_neighbors=model_data["n_neighbors"],
-            max_features=model_data["max_features"],
+            n_neighbors=metadata["n_neighbors"],
+            max_features=metadata["max_features"],
             use_gpu=use_gpu,
         )
 
-        model.vectorizer.vocabulary = model_data["vectorizer_vocabulary"]
-        model.vectorizer.idf = model_data["vectorizer_idf"]
+        tokens = metadata["vectorizer_vocabulary"]
+        model.vectorizer.vocabulary = {token: idx for idx, token in enumerate(tokens)}
+        model.vectorizer.idf = dict(zip(tokens, idf.tolist()))
+        model.vectorizer._index_idf()
         model.vectorizer.fitted = True
 
-        model.training_inputs = model_data["training_inputs"]
-        model.training_outputs = model_data["training_outputs"]
+        model.training_inputs = training_inputs
+        model._set_training_outputs(training_outputs)
         model.training_vectors = (
-            np.array(model_data["training_vectors"]) if model_data["training_vectors"] else None
+            np.ascontiguousarray(training_vectors, dtype=np.float32)
+            if training_vectors is not None
+            else None
         )
         model.is_trained = True
+        model._check_corpus_size_for_device()
 
         print(f"Model loaded from {filepath}")
         return model
 
-    def evaluate(self, test_inputs: List[str], test_outputs: List[str]) -> Dict[str, float]:
+    def evaluate(self, test_inputs: Sequence[str], test_outputs: Sequence[str]) -> Dict[str, float]:
         """
         Evaluate the model on test data.
 
@@ -491,9 +861,9 @@ class LazyModeModel:
             "Proposed Tasks",
         ]
 
-        for input_text, _expected_output in zip(test_inputs, test_outputs):
-            predicted = self.predict(input_text)
+        predictions = self.predict_batch(test_inputs)
 
+        for predicted, _expected_output in zip(predictions, test_outputs):
             # Check structural correctness
             has_title = predicted.startswith("##")
             has_description = "### Description" in predicted
@@ -517,36 +887,35 @@ class LazyModeModel:
 
     def get_model_size(self) -> int:
         """
-        Get approximate model size in bytes.
+        Get the size of the model's data in bytes.
+
+        Counts the UTF-8 encoded training texts, the vector matrix, and the
+        vocabulary tokens with their column index and IDF weight.
 
         Returns:
             Model size in bytes.
         """
-        import sys
-
         size = 0
-        size += sys.getsizeof(self.training_inputs)
-        size += sys.getsizeof(self.training_outputs)
+        size += sum(len(text.encode("utf-8")) for text in self.training_inputs)
+        size += sum(len(text.encode("utf-8")) for text in self.training_outputs)
         if self.training_vectors is not None:
             size += self.training_vectors.nbytes
-        size += sys.getsizeof(self.vectorizer.vocabulary)
-        size += sys.getsizeof(self.vectorizer.idf)
+        # 8 bytes each for the column index and the IDF weight
+        size += sum(len(token.encode("utf-8")) + 16 for token in self.vectorizer.vocabulary)
 
         return size
 
 
 if __name__ == "__main__":
     # Quick test
-    from lazymode.data import generate_training_data, prepare_training_pairs
+    from lazymode.data import get_training_arrays
 
-    # Generate training data
-    data = generate_training_data()
-    pairs = prepare_training_pairs(data)
-    inputs, outputs = zip(*pairs)
+    # Get training data
+    inputs, outputs = get_training_arrays()
 
     # Create and train model
     model = LazyModeModel(n_neighbors=3, use_gpu=False)
-    metrics = model.train(list(inputs), list(outputs))
+    metrics = model.train(inputs, outputs)
     print(f"Training metrics: {metrics}")
 
     # Test prediction
@@ -12,38 +12,41 @@ import argparse
 import os
 import sys
 import time
-from typing import List, Tuple
+from typing import TYPE_CHECKING, Sequence, Tuple, TypeVar
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from lazymode.data import generate_training_data, prepare_training_pairs, save_dataset
-from lazymode.model import LazyModeModel
+# The model and data modules pull in NumPy, so they are imported inside the
+# functions that need them; `lazymode-train --help` stays argparse-only.
+if TYPE_CHECKING:
+    from lazymode.model import LazyModeModel
 
+T = TypeVar("T")
 
-def split_data(
-    pairs: List[Tuple[str, str]], train_ratio: float = 0.8
-) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+
+def split_data(items: Sequence[T], train_ratio: float = 0.8) -> Tuple[Sequence[T], Sequence[T]]:
     """
     Split data into training and validation sets.
 
     Args:
-        pairs: List of (input, output) pairs.
+        items: Sequence of examples, e.g. (input, output) pairs or one of
+            the parallel input/output sequences.
         train_ratio: Ratio of data for training.
 
     Returns:
-        Training pairs and validation pairs.
+        Training items and validation items.
     """
-    split_idx = int(len(pairs) * train_ratio)
-    return pairs[:split_idx], pairs[split_idx:]
+    split_idx = int(len(items) * train_ratio)
+    return items[:split_idx], items[split_idx:]
 
 
 def train_model(
     use_gpu: bool = True,
-    save_path: str = "models/lazymode.pkl",
+    save_path: str = "models/lazymode.npz",
     data_path: str = "data/training_data.json",
     verbose: bool = True,
-) -> LazyModeModel:
+) -> "LazyModeModel":
     """
     Train the LazyMode model.
 
@@ -56,6 +59,9 @@ def train_model(
     Returns:
         Trained model.
     """
+    from lazymode.data import generate_training_data, get_training_arrays, save_dataset
+    from lazymode.model import LazyModeModel
+
     start_time = time.time()
 
     if verbose:
@@ -69,7 +75,7 @@ def train_model(
         print("Generating training data...")
 
     data = generate_training_data()
-    save_dataset(data, data_path)
+    save_dataset(data, data_path, pretty=True)
 
     if verbose:
         print(f"Generated {len(data)} training examples")
@@ -77,11 +83,9 @@ def train_model(
         print()
 
     # Prepare data
-    pairs = prepare_training_pairs(data)
-    train_pairs, val_pairs = split_data(pairs, train_ratio=0.9)
-
-    train_inputs, train_outputs = zip(*train_pairs)
-    val_inputs, val_outputs = zip(*val_pairs)
+    inputs, outputs = get_training_arrays()
+    train_inputs, val_inputs = split_data(inputs, train_ratio=0.9)
+    train_outputs, val_outputs = split_data(outputs, train_ratio=0.9)
 
     if verbose:
         print(f"Training examples: {len(train_inputs)}")
@@ -97,14 +101,14 @@ def train_model(
     if verbose:
         print("Training model...")
 
-    metrics = model.train(list(train_inputs), list(train_outputs), verbose=verbose)
+    metrics = model.train(train_inputs, train_outputs, verbose=verbose)
 
     # Evaluate model
     if verbose:
         print()
         print("Evaluating model...")
 
-    eval_metrics = model.evaluate(list(val_inputs), list(val_outputs))
+    eval_metrics = model.evaluate(val_inputs, val_outputs)
 
     if verbose:
         print(f"Structural accuracy: {eval_metrics['structural_accuracy']:.2%}")
@@ -127,7 +131,7 @@ def train_model(
         print("Training Complete!")
         print("=" * 60)
         print(f"Training time: {elapsed_time:.2f} seconds")
-        print(f"Model size (in memory): {model_size_mb:.2f} MB")
+        print(f"Model size (data): {model_size_mb:.2f} MB")
         print(f"Device used: {model.device}")
         print(f"Vocabulary size: {metrics['vocabulary_size']}")
         print()
@@ -135,7 +139,7 @@ def train_model(
     return model
 
 
-def run_demo(model: LazyModeModel) -> None:
+def run_demo(model: "LazyModeModel") -> None:
     """
     Run a demo of the trained model.
 
@@ -176,7 +180,7 @@ def main():
     parser.add_argument(
         "--model-path",
         type=str,
-        default="models/lazymode.pkl",
+        default="models/lazymode.npz",
         help="Path to save the trained model",
     )
     parser.add_argument(
@@ -0,0 +1,43 @@
+"""Shared fixtures for the LazyMode tests."""
+
+import os
+import sys
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from lazymode.data import generate_training_data, prepare_training_pairs
+from lazymode.inference import PREBUILT_MODEL_PATH
+from lazymode.model import LazyModeModel
+
+
+@pytest.fixture(scope="session")
+def all_training_data():
+    """Generate the full training dataset once; tests must not mutate it."""
+    return generate_training_data()
+
+
+@pytest.fixture(scope="session")
+def trained_model(all_training_data):
+    """Create a model trained on a subset of the corpus, shared by all tests."""
+    data = all_training_data[:20]  # Use subset for speed
+    pairs = prepare_training_pairs(data)
+    inputs, outputs = zip(*pairs)
+
+    model = LazyModeModel(n_neighbors=3, max_features=200, use_gpu=False)
+    model.train(list(inputs), list(outputs), verbose=False)
+    return model
+
+
+@pytest.fixture(scope="session")
+def full_model():
+    """Load the shipped model, which is trained on the full corpus."""
+    return LazyModeModel.load(PREBUILT_MODEL_PATH, use_gpu=False)
+
+
+@pytest.fixture(autouse=True)
+def isolated_model_cache(monkeypatch, tmp_path_factory):
+    """Point the user model cache at an empty directory for every test."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))